@@ -104,31 +104,26 @@ class _NFCReaderScreenState extends State<NFCReaderScreen> {
 
       // ISO7816 (Smart Card)
       if (tag.data.containsKey('iso7816')) {
-        Iso7816 iso7816 = Iso7816.from(tag);
         techData['ISO7816'] = 'Smart Card detected';
       }
 
       // ISO15693 (Vicinity Card)
       if (tag.data.containsKey('iso15693')) {
-        Iso15693 iso15693 = Iso15693.from(tag);
         techData['ISO15693'] = 'Vicinity Card detected';
       }
 
       // FeliCa (Sony's contactless IC card)
       if (tag.data.containsKey('felica')) {
-        Felica felica = Felica.from(tag);
         techData['FeliCa'] = 'FeliCa card detected';
       }
 
       // Mifare Classic
       if (tag.data.containsKey('mifareclassic')) {
-        MifareClassic mifare = MifareClassic.from(tag);
         techData['MifareClassic'] = 'Mifare Classic card detected';
       }
 
       // Mifare Ultralight
       if (tag.data.containsKey('mifareultralight')) {
-        MifareUltralight mifare = MifareUltralight.from(tag);
         techData['MifareUltralight'] = 'Mifare Ultralight card detected';
       }
 